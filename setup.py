@@ -11,7 +11,6 @@ setup(
         'PyYAML>=6.0',
         'colorlog>=6.7.0',
         'python-dotenv>=1.0.0',
-        'GitPython>=3.1.45',
     ],
     entry_points={
         'console_scripts': [
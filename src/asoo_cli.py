@@ -1,16 +1,12 @@
 # src/asoo_cli.py
 import argparse
+import importlib
 import sys
 import os
 
 # Absolute imports from the 'src' package
 from common.logger_utils import setup_logger
 from common.cli_config import CLIConfig
-from submodule.commands import SubmoduleCommands
-
-# Get CLI configuration for the program name
-cli_config = CLIConfig()
-CLI_COMMAND_NAME = cli_config.get_command_name()
 
 # Configure the main logger
 logger = setup_logger("CLI_Manager")
@@ -20,9 +16,23 @@ class AsooCli:
     """
     Main class for managing the command-line interface and dispatching commands.
     """
+
+    # Registry of available subcommands. Handler modules are imported lazily
+    # so that invocations that do not use a subcommand (e.g. '--help') do not
+    # pay for the heavy imports (yaml, dotenv, ...).
+    COMMAND_REGISTRY = {
+        "submodule": (
+            "submodule.commands",
+            "SubmoduleCommands",
+            "Operations related to Git (clone, update, etc.).",
+        ),
+    }
+
     def __init__(self):
+        cli_config = CLIConfig()
+        self.command_name = cli_config.get_command_name()
         self.parser = argparse.ArgumentParser(
-            prog=CLI_COMMAND_NAME,
+            prog=self.command_name,
             description="A modular CLI tool for Git repository management and other operations.",
             formatter_class=argparse.RawTextHelpFormatter
         )
@@ -34,17 +44,32 @@ class AsooCli:
         self.execution_path = os.getcwd()
         self._register_commands()
 
+    def _detect_command(self) -> str:
+        """
+        Peeks at sys.argv for the first non-flag token, i.e. the subcommand
+        the user is about to run. Returns None when no subcommand is present.
+        """
+        for token in sys.argv[1:]:
+            if not token.startswith('-'):
+                return token
+        return None
+
     def _register_commands(self):
         """
-        Registers different commands (e.g., 'git', 'ci', etc.).
-        Each command is added through its own handler class.
+        Registers different commands (e.g., 'submodule', 'ci', etc.).
+        Only the subcommand detected in sys.argv gets its full handler
+        (imported and built); the rest are registered as cheap placeholders
+        so they still show up in '--help'.
         """
-        # Register the 'git' command
-        submodule_commands_handler = SubmoduleCommands(self)
-        submodule_commands_handler.add_subparser(
-            self.subparsers,
-            CLI_COMMAND_NAME
-        )
+        requested = self._detect_command()
+        for name, (module_name, class_name, help_text) in self.COMMAND_REGISTRY.items():
+            if name == requested:
+                module = importlib.import_module(module_name)
+                handler = getattr(module, class_name)(self)
+                handler.add_subparser(self.subparsers, self.command_name)
+            else:
+                # Placeholder parser: enough for '--help' output, never run.
+                self.subparsers.add_parser(name, help=help_text)
 
     def run(self):
         """
@@ -1,10 +1,16 @@
 # src/common/cli_config.py
+import json
 import os
 import yaml
 from typing import Dict, Any, Optional
 
 from .logger_utils import setup_logger
 
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
 logger = setup_logger(__name__)
 
 
@@ -47,8 +53,14 @@ class CLIConfig:
 
         if actual_config_path and os.path.exists(actual_config_path):
             try:
-                with open(actual_config_path, 'r', encoding='utf-8') as f:
-                    self._config_data = yaml.safe_load(f)
+                st = os.stat(actual_config_path)
+                cached = self._load_json_cache(actual_config_path, st)
+                if cached is not None:
+                    self._config_data = cached
+                else:
+                    with open(actual_config_path, 'r', encoding='utf-8') as f:
+                        self._config_data = yaml.load(f, Loader=_Loader)
+                    self._write_json_cache(actual_config_path, st)
                 logger.info(f"CLI configuration loaded from: {actual_config_path}")
             except yaml.YAMLError as e:
                 logger.error(f"Error parsing CLI configuration file {actual_config_path}: {e}")
@@ -57,6 +69,46 @@ class CLIConfig:
 
         self._is_loaded = True
 
+    @staticmethod
+    def _cache_path(config_path: str) -> str:
+        return config_path + '.cache.json'
+
+    def _load_json_cache(self, config_path: str, st: os.stat_result) -> Optional[Dict[str, Any]]:
+        """
+        Returns the cached configuration when the JSON sidecar is still fresh
+        (same mtime and size as the YAML source), None otherwise.
+        json.loads is much faster than a YAML parse, so warm starts skip
+        PyYAML entirely.
+        """
+        try:
+            with open(self._cache_path(config_path), 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+            if (cache.get('mtime') == st.st_mtime_ns
+                    and cache.get('size') == st.st_size):
+                return cache.get('data')
+        except (OSError, ValueError):
+            pass
+        return None
+
+    def _write_json_cache(self, config_path: str, st: os.stat_result):
+        """
+        Persists the parsed configuration as a JSON sidecar, written to a
+        temp file and moved into place atomically. Failures are ignored:
+        the cache is a pure optimization.
+        """
+        cache_path = self._cache_path(config_path)
+        tmp_path = cache_path + '.tmp'
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({
+                    'mtime': st.st_mtime_ns,
+                    'size': st.st_size,
+                    'data': self._config_data,
+                }, f)
+            os.replace(tmp_path, cache_path)
+        except (OSError, TypeError, ValueError):
+            pass
+
     def get(self, key: str, default: Any = None) -> Any:
         """
         Retrieves a value from the CLI configuration.
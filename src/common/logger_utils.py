@@ -2,26 +2,26 @@
 import logging
 import sys
 
-from colorlog import ColoredFormatter
+# Whether the root handler has been installed yet. Handler/formatter setup
+# (and the colorlog import) happens at most once per process.
+_CONFIGURED = False
 
+# Loggers already configured by setup_logger, keyed by (name, level).
+# Module imports call setup_logger once each; the memo makes repeated
+# calls (re-imports, helper modules sharing a name) a dict hit.
+_LOGGERS = {}
 
-def setup_logger(name: str = "CLI_Tool", level: int = logging.INFO) -> logging.Logger:
-    """
-    Configures and returns a logger with colored console output.
 
-    Args:
-        name (str): The name of the logger.
-        level (int): The minimum logging level for messages (e.g., logging.INFO, logging.DEBUG).
-
-    Returns:
-        logging.Logger: A configured logger instance.
+def _install_root_handler(level: int):
     """
-    logger = logging.getLogger(name)
-    logger.setLevel(level)
+    Attaches a single console handler to the root logger. Uses colorlog's
+    ColoredFormatter only when stdout is a TTY; piped output gets a plain
+    stdlib formatter and never pays the colorlog import.
+    """
+    handler = logging.StreamHandler(sys.stdout)
+    if sys.stdout.isatty():
+        from colorlog import ColoredFormatter
 
-    # Prevent adding multiple handlers if the logger has already been configured
-    if not logger.handlers:
-        handler = logging.StreamHandler(sys.stdout)
         # Log format: Colored Level, Timestamp, Logger Name, Message
         formatter = ColoredFormatter(
             "%(log_color)s%(bold)s%(levelname)s%(reset)s %(message)s",
@@ -36,7 +36,39 @@ def setup_logger(name: str = "CLI_Tool", level: int = logging.INFO) -> logging.L
             secondary_log_colors={},
             style='%'
         )
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
+    else:
+        formatter = logging.Formatter("%(levelname)s %(message)s")
+    handler.setFormatter(formatter)
+    root = logging.getLogger()
+    root.setLevel(level)
+    root.addHandler(handler)
 
+
+def setup_logger(name: str = "CLI_Tool", level: int = logging.INFO) -> logging.Logger:
+    """
+    Returns a logger with colored console output.
+
+    The console handler is installed once on the root logger; per-name
+    loggers simply propagate to it, so repeated calls are cheap and never
+    stack duplicate handlers.
+
+    Args:
+        name (str): The name of the logger.
+        level (int): The minimum logging level for messages (e.g., logging.INFO, logging.DEBUG).
+
+    Returns:
+        logging.Logger: A configured logger instance.
+    """
+    cached = _LOGGERS.get((name, level))
+    if cached is not None:
+        return cached
+
+    global _CONFIGURED
+    if not _CONFIGURED:
+        _install_root_handler(level)
+        _CONFIGURED = True
+
+    logger = logging.getLogger(name)
+    logger.setLevel(level)
+    _LOGGERS[(name, level)] = logger
     return logger
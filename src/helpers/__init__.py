@@ -1 +0,0 @@
-# src/helpers/__init__.py
@@ -11,6 +11,22 @@ from submodule.operations import SubmoduleOperations
 logger = setup_logger(__name__)
 
 
+class _FastParser(argparse.ArgumentParser):
+    """
+    ArgumentParser that caches its HelpFormatter. argparse calls
+    _get_formatter repeatedly while arguments are added (each call scans
+    environment variables on recent Pythons); one formatter per parser
+    instance is enough.
+    """
+    def _get_formatter(self):
+        formatter = getattr(self, "_cached_formatter", None)
+        if formatter is None:
+            formatter = self._cached_formatter = self.formatter_class(
+                prog=self.prog
+            )
+        return formatter
+
+
 class SubmoduleCommands:
     """
     Manages Git-related subcommands (clone, update, etc.).
@@ -23,6 +39,32 @@ class SubmoduleCommands:
         self.config_name = None
         self.hidden_config = None
         self.hidden_config_name = None
+        self._loaded = False
+
+    # Help lines for each operation; also used for the cheap placeholder
+    # parsers registered when another operation was invoked.
+    _OPERATION_HELP = {
+        "add": "Adds a new repository to the YAML file.",
+        "update": "Updates existing repositories to their latest commit or specified commit.",
+        "rm": "Removes a repository from the YAML file.",
+        "generate": "Generate a new YAML from .gitmodules file.",
+    }
+
+    @staticmethod
+    def _detect_operation():
+        """
+        Peeks at sys.argv for the token following 'submodule', i.e. the
+        operation about to run. Returns None when absent (e.g. '--help').
+        """
+        argv = sys.argv[1:]
+        try:
+            index = argv.index("submodule")
+        except ValueError:
+            return None
+        for token in argv[index + 1:]:
+            if not token.startswith('-'):
+                return token
+        return None
 
     def add_subparser(self, subparsers: argparse._SubParsersAction, cli_command_name: str):
         """
@@ -46,16 +88,62 @@ Usage:
         submodule_subparsers = submodule_parser.add_subparsers(
             dest="command",
             help="Available Git operations",
-            required=True
+            required=True,
+            parser_class=_FastParser
+        )
+
+        # Build the full parser only for the operation actually present on
+        # the command line; the rest get placeholder entries so they still
+        # show up in 'submodule --help'. When no operation can be detected
+        # (help output, typos) everything is built.
+        builders = {
+            "add": self._build_add_parser,
+            "update": self._build_update_parser,
+            "rm": self._build_rm_parser,
+            "generate": self._build_generate_parser,
+        }
+        requested = self._detect_operation()
+        if requested in builders:
+            builders[requested](submodule_subparsers)
+            for name, help_text in self._OPERATION_HELP.items():
+                if name != requested:
+                    submodule_subparsers.add_parser(name, help=help_text)
+        else:
+            for builder in builders.values():
+                builder(submodule_subparsers)
+
+    def _config_parent_parser(self) -> argparse.ArgumentParser:
+        """
+        Arguments shared by every config-file based subcommand. The config
+        file default stays None here and is resolved against the execution
+        path at load time, not at parser-construction time.
+        """
+        config_parent = argparse.ArgumentParser(add_help=False)
+        config_parent.add_argument(
+            "-f", "--file",
+            type=str,
+            dest="config_file",
+            default=None,
+            help="Path to the YAML file containing repository configurations. "
+                 "Default: 'repositories.yml' in the execution directory."
+        )
+        config_parent.add_argument(
+            "--env-file",
+            type=str,
+            dest="env_file",
+            default=None,
+            help="Path to the .env file to load environment variables. Default: searches for '.env' in CWD."
         )
+        return config_parent
 
-        # 'submodule add' subcommand
+    def _build_add_parser(self, submodule_subparsers: argparse._SubParsersAction):
         add_parser = submodule_subparsers.add_parser(
             "add",
-            help="Adds a new repository to the YAML file.",
+            help=self._OPERATION_HELP["add"],
             description="""
 Adds a new repository to the YAML file.
-            """
+            """,
+            parents=[self._config_parent_parser()]
         )
         add_parser.add_argument(
             "-b", "--branch",
@@ -72,21 +160,6 @@ Adds a new repository to the YAML file.
             type=str,
             help="Normally relative to the root of the project. Path to the repository to add (e.g., path/to/repo)."
         )
-        add_parser.add_argument(
-            "-f", "--file",
-            type=str,
-            dest="config_file",
-            default=os.path.join(self.cli.execution_path, 'repositories.yml'),
-            help="Path to the YAML file containing repository configurations. "
-                 "Default: 'repositories.yml' in the 'src' root directory."
-        )
-        add_parser.add_argument(
-            "--env-file",
-            type=str,
-            dest="env_file",
-            default=None,
-            help="Path to the .env file to load environment variables. Default: searches for '.env' in CWD."
-        )
         add_parser.add_argument(
             "-c", "--commit",
             type=str,
@@ -111,28 +184,15 @@ Adds a new repository to the YAML file.
         )
         add_parser.set_defaults(func=self.handle_submodule_operation)
 
-        # 'submodule update' subcommand
+    def _build_update_parser(self, submodule_subparsers: argparse._SubParsersAction):
         update_parser = submodule_subparsers.add_parser(
             "update",
-            help="Updates existing repositories to their latest commit or specified commit.",
+            help=self._OPERATION_HELP["update"],
             description="""
 Updates already cloned repositories.
 This option is similar to 'clone' but focused on existing repositories.
-            """
-        )
-        update_parser.add_argument(
-            "-f", "--file",
-            type=str,
-            dest="config_file",
-            default=os.path.join(self.cli.execution_path, 'repositories.yml'),
-            help="Path to the YAML file containing repository configurations."
-        )
-        update_parser.add_argument(
-            "--env-file",
-            type=str,
-            dest="env_file",
-            default=None,
-            help="Path to the .env file to load environment variables. Default: searches for '.env' in CWD."
+            """,
+            parents=[self._config_parent_parser()]
         )
         update_parser.add_argument(
             "-p", "--path",
@@ -167,27 +227,14 @@ This option is similar to 'clone' but focused on existing repositories.
         )
         update_parser.set_defaults(func=self.handle_submodule_operation)
 
-        # 'submodule rm' subcommand
+    def _build_rm_parser(self, submodule_subparsers: argparse._SubParsersAction):
         rm_parser = submodule_subparsers.add_parser(
             "rm",
-            help="Removes a repository from the YAML file.",
+            help=self._OPERATION_HELP["rm"],
             description="""
 Removes a repository from the YAML file.
-            """
-        )
-        rm_parser.add_argument(
-            "-f", "--file",
-            type=str,
-            dest="config_file",
-            default=os.path.join(self.cli.execution_path, 'repositories.yml'),
-            help="Path to the YAML file containing repository configurations."
-        )
-        rm_parser.add_argument(
-            "--env-file",
-            type=str,
-            dest="env_file",
-            default=None,
-            help="Path to the .env file to load environment variables. Default: searches for '.env' in CWD."
+            """,
+            parents=[self._config_parent_parser()]
         )
         rm_parser.add_argument(
             "path",
@@ -196,10 +243,10 @@ Removes a repository from the YAML file.
         )
         rm_parser.set_defaults(func=self.handle_submodule_operation)
 
-        # 'submodule generate' subcommand
+    def _build_generate_parser(self, submodule_subparsers: argparse._SubParsersAction):
         generate_parser = submodule_subparsers.add_parser(
             "generate",
-            help="Generate a new YAML from .gitmodules file.",
+            help=self._OPERATION_HELP["generate"],
             description="""
 Generate a new YAML from .gitmodules file.
             """
@@ -208,46 +255,61 @@ Generate a new YAML from .gitmodules file.
             "-gm", "--gitmodules",
             type=str,
             dest="gitmodules_file",
-            default=os.path.join(self.cli.execution_path, '.gitmodules'),
-            help="Path to the .gitmodules file to generate the YAML from."
+            default=None,
+            help="Path to the .gitmodules file to generate the YAML from. "
+                 "Default: '.gitmodules' in the execution directory."
         )
         generate_parser.add_argument(
             "-o", "--output",
             type=str,
             dest="output_file",
-            default=os.path.join(self.cli.execution_path, 'repositories.yml'),
-            help="Path to the YAML file to generate."
+            default=None,
+            help="Path to the YAML file to generate. "
+                 "Default: 'repositories.yml' in the execution directory."
         )
         generate_parser.set_defaults(func=self.handle_submodule_operation)
 
+    # Operation name -> handler method; an O(1) lookup instead of getattr
+    # with AttributeError as control flow.
+    _COMMANDS = {
+        "add": "command_add",
+        "update": "command_update",
+        "rm": "command_rm",
+        "generate": "command_generate",
+    }
+
     def handle_submodule_operation(self, args: argparse.Namespace):
-        try:
-            method = getattr(self, f"command_{args.command}")
-        except AttributeError:
+        method_name = self._COMMANDS.get(args.command)
+        if method_name is None:
             logger.error(f"Invalid submodule command: {args.command}")
             sys.exit(1)
 
-        self.remove_deleted_submodules(args)
-        method(args)
+        # 'generate' takes no repositories config; every other operation
+        # loads it exactly once here, not again per command.
+        if hasattr(args, 'config_file'):
+            self._load_config(args)
+        getattr(self, method_name)(args)
 
-    def remove_deleted_submodules(self, args: argparse.Namespace):
-        self._load_config(args)
+    def remove_deleted_submodules(self):
         if not self.config:
             return
 
-        repositories = [r.get('path') for r in self.config.get_repositories()]
+        repositories = {r.get('path') for r in self.config.get_repositories()}
         old_repositories = self.hidden_config.get_repositories()
-        for repository in old_repositories:
+        removed = False
+        for repository in list(old_repositories):
             repo_path = repository.get('path')
             if repo_path not in repositories:
                 self.operations.rm(repository, self.config_path)
                 self._remove_config_repository(repo_path)
+                removed = True
+        if removed:
+            self._save_configs()
 
     def command_add(
         self,
         args: argparse.Namespace,
     ):
-        self._load_config(args)
         if self.config.get_repositories(path=args.path):
             logger.error(f"Repository '{args.path}' already exists.")
             sys.exit(1)
@@ -279,10 +341,9 @@ Generate a new YAML from .gitmodules file.
 
         # Update YAML file
         self._update_config_commit(path, commit)
+        self._save_configs()
 
     def command_update(self, args: argparse.Namespace):
-        self._load_config(args)
-
         def _get_only_changed_repos(repositories: list[dict]) -> list[dict]:
             to_update = []
             for repo in repositories:
@@ -323,9 +384,8 @@ Generate a new YAML from .gitmodules file.
             logger.info("Already up to date")
             return
 
-        for repo_data in repos:
-            # Update repository
-            commit = self.operations.update(
+        def _update_repo(repo_data: dict):
+            return self.operations.update(
                 repo_data,
                 self.config_path,
                 args.remote,
@@ -333,17 +393,58 @@ Generate a new YAML from .gitmodules file.
                 args.ignore_local_changes,
                 args.jobs
             )
-            if not commit:
-                continue
 
-            # Update YAML file
-            self._update_config_commit(repo_data.get('path'), commit)
+        # Commit updates accumulate in memory; the configs are written once
+        # at the end (also on interrupt, so partial progress is kept).
+        try:
+            if args.jobs > 1 and len(repos) > 1:
+                # Resolve the lose-local-changes prompts here, before any
+                # worker starts: stdin prompts issued from the pool would
+                # interleave and answers could attach to the wrong repo.
+                # Workers then run with confirmation already settled.
+                ignore_local_changes = args.ignore_local_changes
+                if not ignore_local_changes:
+                    repos = [
+                        repo_data for repo_data in repos
+                        if self.operations.confirm_local_changes(
+                            repo_data, self.config_path
+                        )
+                    ]
+                    ignore_local_changes = True
+
+                # Repositories are processed concurrently by the operations
+                # layer; config mutations happen here in the main thread as
+                # results come back.
+                for repo_data, commit in self.operations.update_many(
+                    repos,
+                    self.config_path,
+                    args.remote,
+                    args.git_clean,
+                    ignore_local_changes,
+                    args.jobs
+                ):
+                    if commit:
+                        self._update_config_commit(
+                            repo_data.get('path'), commit
+                        )
+            else:
+                # Hot per-repo loop: bind the method once instead of per
+                # iteration.
+                update_config_commit = self._update_config_commit
+                for repo_data in repos:
+                    # Update repository
+                    commit = _update_repo(repo_data)
+                    if not commit:
+                        continue
+
+                    update_config_commit(repo_data.get('path'), commit)
+        finally:
+            self._save_configs()
 
     def command_rm(
         self,
         args: argparse.Namespace,
     ):
-        self._load_config(args)
         repo_data = self.config.get_repositories(path=args.path)
         if not repo_data:
             logger.error(f"Repository '{args.path}' not found.")
@@ -354,12 +455,21 @@ Generate a new YAML from .gitmodules file.
 
         # Remove repository from config
         self._remove_config_repository(args.path)
+        self._save_configs()
 
     def command_generate(
         self,
         args: argparse.Namespace,
     ):
-        self.operations.generate(args.gitmodules_file, args.output_file)
+        # Defaults resolve against the execution path at run time, not at
+        # parser-construction time.
+        gitmodules_file = args.gitmodules_file or os.path.join(
+            self.cli.execution_path, '.gitmodules'
+        )
+        output_file = args.output_file or os.path.join(
+            self.cli.execution_path, 'repositories.yml'
+        )
+        self.operations.generate(gitmodules_file, output_file)
 
     # -----------------------------------
     # Config methods
@@ -367,12 +477,22 @@ Generate a new YAML from .gitmodules file.
     def _load_config(self, args: argparse.Namespace):
         if not hasattr(args, 'config_file'):
             return
+        # Loading also reconciles deleted submodules below; doing either
+        # twice per invocation would just redo identical work.
+        if self._loaded:
+            return
+        self._loaded = True
 
+        config_file = args.config_file or 'repositories.yml'
         config_file_path = os.path.join(
             self.cli.execution_path,
-            args.config_file
-        ) if not os.path.isabs(args.config_file) else args.config_file
-        if not os.path.exists(config_file_path):
+            config_file
+        ) if not os.path.isabs(config_file) else config_file
+        # One stat answers the existence check; the config's own load
+        # re-uses a stat of its own as parse-cache key.
+        try:
+            os.stat(config_file_path)
+        except FileNotFoundError:
             logger.critical(
                 f"Configuration file not found: {config_file_path}"
             )
@@ -394,6 +514,10 @@ Generate a new YAML from .gitmodules file.
         )
         self.hidden_config.load_config()
 
+        # Reconcile entries removed from the main config while both files
+        # are already loaded and indexed.
+        self.remove_deleted_submodules()
+
     def _add_config_repository(
         self,
         path: str,
@@ -406,8 +530,11 @@ Generate a new YAML from .gitmodules file.
         self.hidden_config.add_repository(path, url, branch, commit, depth)
 
     def _update_config_commit(self, path: str, commit: str):
+        """
+        Records a new commit for a repository in both configs, in memory
+        only — callers batch the writes via _save_configs.
+        """
         self.config.update_repository_commit(path, commit)
-        self.config.save_config()
 
         # Add repository to hidden config if it doesn't exist
         if not self.hidden_config.get_repositories(path=path):
@@ -421,10 +548,11 @@ Generate a new YAML from .gitmodules file.
             )
         else:
             self.hidden_config.update_repository_commit(path, commit)
-        self.hidden_config.save_config()
 
     def _remove_config_repository(self, path: str):
         self.config.remove_repository(path)
-        self.config.save_config()
         self.hidden_config.remove_repository(path)
+
+    def _save_configs(self):
+        self.config.save_config()
         self.hidden_config.save_config()
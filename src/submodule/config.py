@@ -1,14 +1,67 @@
 # src/common/config.py
+import copy
+import json
 import yaml
 import os
 import re
+import sys
 from typing import List, Dict, Any, Optional
 from dotenv import load_dotenv
 
 from common.logger_utils import setup_logger
 
+# Prefer the libyaml C bindings; fall back to the pure-Python
+# implementations when PyYAML was built without them.
+try:
+    from yaml import CSafeLoader as _Loader, CSafeDumper as _Dumper
+except ImportError:
+    from yaml import SafeLoader as _Loader, SafeDumper as _Dumper
+
 logger = setup_logger(__name__)
 
+# Compiled once at import time; matches placeholders like ${VAR_NAME}.
+_ENV_RE = re.compile(r'\$\{(\w+)\}')
+
+
+def _replace_env_var(match):
+    """
+    re.sub callback for a single ${VAR_NAME} placeholder. Module-level so
+    no closure has to be rebuilt per resolved string.
+    """
+    var_name = match.group(1)
+    value = os.environ.get(var_name)
+    if value is None:
+        logger.warning(f"Environment variable '{var_name}' not found in .env or environment. "
+                       "Placeholder will be kept in YAML.")
+        return match.group(0) # Return the original placeholder if variable is not found
+    return value
+
+# Parsed (and env-resolved) configs keyed by (abspath, mtime_ns, size).
+# A command typically loads the same file more than once per process
+# (main + hidden config, reconciliation + command); cache hits skip the
+# YAML parser entirely. Entries are deep-copied in both directions since
+# callers mutate the returned tree in place.
+_PARSE_CACHE: Dict[tuple, Dict[str, Any]] = {}
+
+
+class _EnvLoader(_Loader):
+    """
+    YAML loader that resolves ${VAR} placeholders while string scalars are
+    being constructed, so the document needs no second resolution pass.
+    The owning SubmoduleConfig is attached as 'config' before loading.
+    """
+    config = None
+
+
+def _construct_env_str(loader, node):
+    value = loader.construct_scalar(node)
+    if loader.config is not None:
+        return loader.config._resolve_env_string(value)
+    return value
+
+
+_EnvLoader.add_constructor('tag:yaml.org,2002:str', _construct_env_str)
+
 
 class SubmoduleConfig:
     """
@@ -18,64 +71,151 @@ class SubmoduleConfig:
     def __init__(self, config_path: str, env_path: Optional[str] = None):
         self.config_path = config_path
         self.config_data: Optional[Dict[str, Any]] = {'repositories': []}
+        self._by_path: Dict[str, Dict[str, Any]] = {}
+        # Set by the mutators below; save_config skips the whole YAML
+        # emit (and sidecar write) while the in-memory data still matches
+        # the file.
+        self._dirty = False
 
         # Create config file if it doesn't exist
         self._create_config_file()
 
-        # Load environment variables upon initialization
-        if env_path and os.path.exists(env_path):
-            load_dotenv(dotenv_path=env_path)
-        else:
-            # If no specific path is provided or the file doesn't exist,
-            # load_dotenv() will search for '.env' in the current directory.
-            load_dotenv()
+        # Environment variables are loaded lazily: load_dotenv walks parent
+        # directories and parses '.env', which is wasted work when the YAML
+        # contains no ${VAR} placeholder at all.
+        self._env_path = env_path
+        self._dotenv_loaded = False
 
     def _create_config_file(self):
-        if not os.path.exists(self.config_path):
-            with open(self.config_path, 'w', encoding='utf-8') as f:
+        # Exclusive-create mode replaces the separate exists() stat: the
+        # common already-exists case costs one failed open.
+        try:
+            with open(self.config_path, 'x', encoding='utf-8') as f:
                 yaml.dump(
                     self.config_data,
                     f,
+                    Dumper=_Dumper,
                     indent=2,
                     default_flow_style=False,
                     sort_keys=False
                 )
+        except FileExistsError:
+            pass
+
+    # .env files already loaded in this process, so repeated config loads
+    # (e.g. main + hidden config, or several instances in tests) don't
+    # re-read the filesystem.
+    _loaded_env_paths = set()
+
+    def _ensure_dotenv_loaded(self):
+        """
+        Loads environment variables from .env on first use. Called from the
+        string branch of _resolve_env_variables, i.e. only when a ${VAR}
+        placeholder is actually present.
+        """
+        if self._dotenv_loaded:
+            return
+        self._dotenv_loaded = True
+
+        env_path = self._env_path if (
+            self._env_path and os.path.exists(self._env_path)
+        ) else None
+        cache_key = os.path.abspath(env_path) if env_path else ''
+        if cache_key in SubmoduleConfig._loaded_env_paths:
+            return
+        SubmoduleConfig._loaded_env_paths.add(cache_key)
+
+        if env_path:
+            load_dotenv(dotenv_path=env_path)
+        else:
+            # If no specific path is provided or the file doesn't exist,
+            # load_dotenv() will search for '.env' in the current directory.
+            load_dotenv()
+
+    def _resolve_env_string(self, data: str) -> str:
+        """
+        Replaces ${VAR_NAME} placeholders in a single string.
+        """
+        # Fast path: the vast majority of strings (URLs, paths,
+        # commit hashes) carry no placeholder at all.
+        if '${' not in data:
+            return data
+        self._ensure_dotenv_loaded()
+        return _ENV_RE.sub(_replace_env_var, data)
 
     def _resolve_env_variables(self, data: Any) -> Any:
         """
-        Recursively traverses a data structure (dict/list) and replaces
-        environment variables in the format ${VAR_NAME}.
-        """
-        if isinstance(data, dict):
-            return {k: self._resolve_env_variables(v) for k, v in data.items()}
-        elif isinstance(data, list):
-            return [self._resolve_env_variables(item) for item in data]
-        elif isinstance(data, str):
-            # Searches for patterns like ${VAR_NAME}
-            def replace_var(match):
-                var_name = match.group(1)
-                value = os.getenv(var_name)
-                if value is None:
-                    logger.warning(f"Environment variable '{var_name}' not found in .env or environment. "
-                                   "Placeholder will be kept in YAML.")
-                    return match.group(0) # Return the original placeholder if variable is not found
-                return value
-            # Use re.sub to replace all occurrences of the pattern
-            return re.sub(r'\$\{(\w+)\}', replace_var, data)
+        Replaces environment variables in the format ${VAR_NAME} throughout
+        a data structure. The load path no longer needs this (strings are
+        resolved during YAML construction); it is kept for callers holding
+        already-parsed trees. Containers are walked iteratively and mutated
+        in place: only matched strings allocate anything new, and object
+        identity is preserved for call sites that rely on it.
+        """
+        if isinstance(data, str):
+            return self._resolve_env_string(data)
+        if not isinstance(data, (dict, list)):
+            return data
+
+        stack = [data]
+        while stack:
+            node = stack.pop()
+            items = node.items() if isinstance(node, dict) else enumerate(node)
+            for key, value in items:
+                if isinstance(value, str):
+                    if '${' in value:
+                        node[key] = self._resolve_env_string(value)
+                elif isinstance(value, (dict, list)):
+                    stack.append(value)
         return data
 
     def load_config(self) -> Optional[Dict[str, Any]]:
         """
         Loads the configuration from the YAML file and resolves environment variables.
         """
-        if not os.path.exists(self.config_path):
-            return None
         try:
+            abs_path = os.path.abspath(self.config_path)
+            try:
+                st = os.stat(abs_path)
+            except FileNotFoundError:
+                return None
+
+            cache_key = (abs_path, st.st_mtime_ns, st.st_size)
+            cached = _PARSE_CACHE.get(cache_key)
+            if cached is not None:
+                self.config_data = copy.deepcopy(cached)
+                self._normalize_config_data()
+                self._build_path_index()
+                return self.config_data
+
+            # Warm start across processes: a JSON sidecar written on save
+            # parses much faster than YAML. Only honoured when its recorded
+            # mtime matches the YAML file's.
+            sidecar = self._load_json_sidecar(st)
+            if sidecar is not None:
+                self.config_data = sidecar
+                self._normalize_config_data()
+                self._intern_repo_keys()
+                self._build_path_index()
+                _PARSE_CACHE[cache_key] = copy.deepcopy(self.config_data)
+                return self.config_data
+
+            # Environment variables are resolved while the document is
+            # constructed (see _EnvLoader), in a single pass over the file.
             with open(self.config_path, 'r', encoding='utf-8') as f:
-                raw_config = yaml.safe_load(f)
+                loader = _EnvLoader(f)
+                loader.config = self
+                try:
+                    raw_config = loader.get_single_data()
+                finally:
+                    loader.dispose()
 
-            # Resolve environment variables after loading the YAML
-            self.config_data = self._resolve_env_variables(raw_config)
+            self.config_data = raw_config
+            self._normalize_config_data()
+            self._intern_repo_keys()
+            self._build_path_index()
+            if raw_config is not None:
+                _PARSE_CACHE[cache_key] = copy.deepcopy(self.config_data)
             return self.config_data
         except yaml.YAMLError as e:
             logger.error(f"Error parsing YAML file {self.config_path}: {e}")
@@ -84,42 +224,102 @@ class SubmoduleConfig:
             logger.error(f"Unexpected error loading YAML file: {e}")
             return None
 
+    def _normalize_config_data(self):
+        """
+        Guarantees config_data is a dict whose 'repositories' entry is a
+        list. Done once per load so every accessor and mutator can index
+        self.config_data['repositories'] directly instead of re-probing
+        for missing or null sections on each call.
+        """
+        if not isinstance(self.config_data, dict):
+            self.config_data = {}
+        if self.config_data.get('repositories') is None:
+            self.config_data['repositories'] = []
+
+    def _intern_repo_keys(self):
+        """
+        Repository dicts repeat the same few keys (path, url, branch,
+        commit, depth), but the YAML/JSON parsers allocate a fresh string
+        per key per repo. Interning shares one object per key across all
+        entries, which also makes their dict lookups pointer comparisons.
+        """
+        repositories = self.config_data['repositories']
+        if not repositories:
+            return
+        intern = sys.intern
+        for index, repo in enumerate(repositories):
+            if isinstance(repo, dict):
+                repositories[index] = {
+                    intern(k): v for k, v in repo.items() if isinstance(k, str)
+                }
+
+    def _build_path_index(self):
+        """
+        Indexes repositories by path so lookups and commit updates are O(1)
+        instead of a linear scan per call.
+        """
+        repositories = self.config_data['repositories']
+        self._by_path = {
+            repo.get('path'): repo
+            for repo in repositories
+            if isinstance(repo, dict) and repo.get('path')
+        }
+
+    def _sidecar_path(self, config_path: str = None) -> str:
+        return (config_path or self.config_path) + '.jsoncache'
+
+    def _load_json_sidecar(self, st: os.stat_result) -> Optional[Dict[str, Any]]:
+        """
+        Reads the JSON sidecar if its header matches the YAML's mtime.
+        The sidecar is only ever written together with the YAML (see
+        save_config), so its contents mirror the file exactly — including
+        already-resolved environment variables.
+        """
+        try:
+            with open(self._sidecar_path(), 'r', encoding='utf-8') as f:
+                header = f.readline().strip()
+                if header != f'# src-mtime: {st.st_mtime_ns}':
+                    return None
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write_json_sidecar(self, config_path: str):
+        """
+        Writes the JSON sidecar for a just-saved YAML file. Best effort:
+        any failure leaves only the YAML, which is always authoritative.
+        """
+        sidecar_path = self._sidecar_path(config_path)
+        tmp_path = sidecar_path + '.tmp'
+        try:
+            st = os.stat(config_path)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(f'# src-mtime: {st.st_mtime_ns}\n')
+                json.dump(self.config_data, f)
+            os.replace(tmp_path, sidecar_path)
+        except (OSError, TypeError, ValueError):
+            pass
+
     def get_repositories(self, path: str = None) -> List[Dict[str, Any]]:
         """
         Returns the list of repository dictionaries.
         """
-        if self.config_data and 'repositories' in self.config_data:
-            repositories = self.config_data.get('repositories') or []
-            if path:
-                repo = [
-                    repo
-                    for repo in repositories
-                    if repo.get('path') == path
-                ]
-                return repo[0] if repo else None
-            else:
-                return repositories
-        return []
+        if path:
+            return self._by_path.get(path)
+        return self.config_data['repositories']
 
     def update_repository_commit(self, repo_path: str, new_commit_hash: str) -> bool:
         """
         Updates the commit hash for a specific repository in the configuration.
         """
-        if not self.config_data or 'repositories' not in self.config_data:
-            logger.warning("No configuration data loaded or 'repositories' section is missing.")
-            return False
-
-        found = False
-        for repo in self.config_data['repositories']:
-            if repo.get('path') == repo_path:
-                repo['commit'] = new_commit_hash
-                found = True
-                break
-
-        if not found:
+        repo = self._by_path.get(repo_path)
+        if repo is None:
             logger.warning(f"Repository with name '{repo_path}' not found in configuration.")
             return False
-        return found
+        if repo.get('commit') != new_commit_hash:
+            repo['commit'] = new_commit_hash
+            self._dirty = True
+        return True
 
     def add_repository(
         self,
@@ -132,34 +332,28 @@ class SubmoduleConfig:
         """
         Adds a new repository to the configuration.
         """
-        if not self.config_data or 'repositories' not in self.config_data:
-            logger.warning("No configuration data loaded or 'repositories' section is missing.")
-            return False
-
-        if not self.config_data['repositories']:
-            self.config_data['repositories'] = []
-
-        self.config_data['repositories'].append({
+        repo = {
             'path': path,
             'url': url,
             'branch': branch,
             'commit': commit,
             'depth': depth,
-        })
+        }
+        self.config_data['repositories'].append(repo)
+        self._by_path[path] = repo
+        self._dirty = True
 
     def remove_repository(self, path: str) -> bool:
         """
         Removes a repository from the configuration.
         """
-        if not self.config_data or 'repositories' not in self.config_data:
-            logger.warning("No configuration data loaded or 'repositories' section is missing.")
-            return False
-
-        self.config_data['repositories'] = [
-            repo
-            for repo in self.config_data['repositories']
-            if repo.get('path') != path
-        ]
+        repo = self._by_path.pop(path, None)
+        if repo is not None:
+            try:
+                self.config_data['repositories'].remove(repo)
+            except ValueError:
+                pass
+            self._dirty = True
         return True
 
     def save_config(self, config_path: str = None) -> bool:
@@ -169,16 +363,42 @@ class SubmoduleConfig:
         if self.config_data is None:
             logger.error("No configuration data to save.")
             return False
+        # Nothing mutated since load (or last save): the file on disk is
+        # already identical, skip the serialization entirely.
+        if not self._dirty:
+            return True
         try:
             config_path = config_path or self.config_path
-            with open(config_path, 'w', encoding='utf-8') as f:
-                yaml.safe_dump(
+            # Dump to a sibling temp file and rename over the target so a
+            # crash or concurrent reader never sees a half-written config.
+            tmp_path = config_path + '.tmp'
+            # Binary stream with a large buffer: the dumper encodes to
+            # UTF-8 itself, skipping the text layer, and the emitter's
+            # many small writes coalesce into few syscalls.
+            with open(tmp_path, 'wb', buffering=65536) as f:
+                yaml.dump(
                     self.config_data,
                     f,
+                    Dumper=_Dumper,
                     indent=2,
                     default_flow_style=False,
-                    sort_keys=False
+                    sort_keys=False,
+                    encoding='utf-8'
                 )
+            os.replace(tmp_path, config_path)
+
+            # Prime the parse cache for the file just written, so the next
+            # load in this process is a cache hit.
+            try:
+                st = os.stat(config_path)
+                _PARSE_CACHE[
+                    (os.path.abspath(config_path), st.st_mtime_ns, st.st_size)
+                ] = copy.deepcopy(self.config_data)
+            except OSError:
+                pass
+
+            self._write_json_sidecar(config_path)
+            self._dirty = False
             return True
         except Exception as e:
             logger.error(f"Error saving configuration to {self.config_path}: {e}")
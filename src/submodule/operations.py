@@ -1,30 +1,103 @@
 # src/submodule/operations.py
+import configparser
+import logging
 import os
 import sys
+import shlex
 import subprocess
 import shutil
-import git
 import yaml
-from collections import OrderedDict
 
-from typing import Optional, Dict, Any
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from typing import Callable, List, Optional, Dict, Any, Tuple
 
-from helpers.yaml import OrderedDictDumper
+try:
+    from yaml import CSafeDumper as _Dumper
+except ImportError:
+    from yaml import SafeDumper as _Dumper
+
+
+# Options every spawned git gets: optional locks off, no background
+# auto-gc mid-run, no fsmonitor daemon handshake. _GIT_CMD is the same
+# prefix as a shell fragment for the _run_git_script chains, so both
+# execution paths behave identically.
+_GIT_COMMON_OPTIONS = (
+    "--no-optional-locks", "-c", "gc.auto=0", "-c", "core.fsmonitor=false"
+)
+_GIT_CMD = "git " + " ".join(_GIT_COMMON_OPTIONS)
+
+# Static tail of every clone argv; built once instead of per call.
+_CLONE_STATIC = ("--filter=blob:none", "--single-branch")
+
+
+def _default_confirm(prompt: str) -> bool:
+    """
+    Interactive stdin confirmation; the default for SubmoduleOperations
+    when no callback is injected.
+    """
+    response = input(prompt)
+    sys.stdout.write("\n")
+    return response.lower() in ('y', 'yes')
+
+
+@lru_cache(maxsize=512)
+def _resolve_paths(base: str, repo_path: str) -> tuple:
+    """
+    Returns (abs_repo_path, parent_dir) for a repository. os.path.abspath
+    hides a getcwd syscall plus normalization per call; the lru_cache
+    answers repeated operations on the same repo from memory.
+    """
+    abs_repo_path = os.path.abspath(os.path.join(base, repo_path))
+    return abs_repo_path, os.path.dirname(abs_repo_path)
 
 
 class SubmoduleOperations:
     """
     Handles low-level Git operations using subprocess calls.
     """
-    def __init__(self, cli_instance, commands_instance, logger_instance):
+    def __init__(
+        self,
+        cli_instance,
+        commands_instance,
+        logger_instance,
+        confirm_cb: Optional[Callable[[str], bool]] = None
+    ):
         self.cli = cli_instance
         self.commands = commands_instance
         self.logger = logger_instance
+        # Asked before discarding local changes. Parallel drivers inject a
+        # non-interactive callback here; blocking several worker threads
+        # on stdin at once would deadlock the prompt.
+        self._confirm = confirm_cb or _default_confirm
+        # The level is fixed at setup_logger time, so one check up front
+        # replaces an isEnabledFor call per spawned subprocess.
+        self._debug = logger_instance.isEnabledFor(logging.DEBUG)
+
+    # Shared across instances; the mapping depends only on the arguments.
+    _resolve_paths = staticmethod(_resolve_paths)
 
     # ------------------------------
     # BASH COMMANDS METHODS
     # ------------------------------
 
+    def _git_env(self, env: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+        """
+        Builds the environment for git subprocesses: optional locks off (so
+        parallel jobs don't contend on .git lock files), terminal prompts
+        disabled (a missing credential fails instead of hanging) and the
+        system-wide /etc/gitconfig skipped — one less file parsed per
+        invocation. credential.helper is deliberately left alone: clearing
+        it would break fetches from authenticated remotes.
+        """
+        base_env = os.environ.copy()
+        base_env['GIT_OPTIONAL_LOCKS'] = '0'
+        base_env['GIT_CONFIG_NOSYSTEM'] = '1'
+        base_env.setdefault('GIT_TERMINAL_PROMPT', '0')
+        if env:
+            base_env.update(env)
+        return base_env
+
     def _run_git_command(
         self,
         command: list,
@@ -36,33 +109,93 @@ class SubmoduleOperations:
         Runs a Git command in the specified path and returns its stdout.
         Handles errors and logs output.
         """
-        full_command = ["git"] + command
-        self.logger.debug(
-            f"Executing command: {' '.join(map(str, full_command))} in {path}"
-        )
+        # gc.auto=0 keeps bulk operations from kicking off background
+        # repacks mid-run; fsmonitor=false skips the daemon handshake.
+        # The target directory travels as 'git -C' rather than cwd=:
+        # combining cwd with a custom env forces subprocess onto the
+        # fork+exec path, while this form stays posix_spawn-eligible.
+        # Callers are expected to pass str arguments already; no defensive
+        # re-stringify pass on the hot path.
+        full_command = ["git", "-C", path, *_GIT_COMMON_OPTIONS] + command
+        if self._debug:
+            self.logger.debug(
+                "Executing command: %s in %s", ' '.join(full_command), path
+            )
         try:
+            # Binary pipes: stderr (often large for clone/fetch) is only
+            # decoded on failure, and stdout skips the TextIOWrapper setup
+            # of text=True. Callers that discard stdout (reset, clean) skip
+            # the pipe and the decode entirely via capture_output=False;
+            # stderr stays piped for error reporting.
             process = subprocess.run(
-                list(map(str, full_command)),
-                cwd=path,
-                capture_output=True,
-                text=True,
+                full_command,
+                stdout=subprocess.PIPE if capture_output else subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 check=True,
-                env=env
+                env=self._git_env(env)
             )
-            self.logger.debug(f"Command stdout: {process.stdout.strip()}")
-            return process.stdout.strip()
+            if not capture_output:
+                return None
+            stdout = process.stdout.decode('utf-8', errors='replace').strip()
+            if self._debug:
+                self.logger.debug("Command stdout: %s", stdout)
+            return stdout
         except subprocess.CalledProcessError as e:
-            self.logger.error(f"Git command failed: {' '.join(full_command)}")
-            self.logger.error(f"Stderr: {e.stderr.strip()}")
-            self.logger.error(f"Stdout: {e.stdout.strip()}")
-            raise RuntimeError(f"Git command failed: {e.stderr.strip()}") from e
+            stderr = e.stderr.decode('utf-8', errors='replace').strip() if e.stderr else ''
+            stdout = e.stdout.decode('utf-8', errors='replace').strip() if e.stdout else ''
+            log_error = self.logger.error
+            log_error("Git command failed: %s", ' '.join(full_command))
+            log_error("Stderr: %s", stderr)
+            log_error("Stdout: %s", stdout)
+            raise RuntimeError(f"Git command failed: {stderr}") from e
         except FileNotFoundError:
             self.logger.error("Git executable not found. Please ensure Git is installed and in your PATH.")
             raise
         except Exception as e:
-            self.logger.error(f"An unexpected error occurred while running Git command: {e}")
+            self.logger.error("An unexpected error occurred while running Git command: %s", e)
             raise
 
+    def _run_git_script(self, commands: List[list], path: str) -> Optional[str]:
+        """
+        Runs a chain of git commands and returns the chain's stdout. Each
+        entry is a git argument list (without the leading 'git'). On POSIX
+        the whole chain becomes a single 'bash -c' invocation, amortizing
+        process startup; where bash is unavailable every command runs
+        individually through _run_git_command and the last one's stdout is
+        returned. The directory change happens inside the script (same
+        posix_spawn-eligibility reasoning as _run_git_command).
+        """
+        if os.name != 'posix':
+            stdout = None
+            for command in commands:
+                stdout = self._run_git_command(command, path)
+            return stdout
+
+        script = " && ".join(
+            _GIT_CMD + " " + " ".join(
+                shlex.quote(str(arg)) for arg in command
+            )
+            for command in commands
+        )
+        if self._debug:
+            self.logger.debug("Executing script: %s in %s", script, path)
+        try:
+            process = subprocess.run(
+                ["bash", "-c", f"cd {shlex.quote(path)} && {script}"],
+                capture_output=True,
+                text=True,
+                check=True,
+                env=self._git_env()
+            )
+            if self._debug:
+                self.logger.debug("Script stdout: %s", process.stdout.strip())
+            return process.stdout.strip()
+        except subprocess.CalledProcessError as e:
+            self.logger.error("Git script failed: %s", script)
+            self.logger.error("Stderr: %s", e.stderr.strip())
+            self.logger.error("Stdout: %s", e.stdout.strip())
+            raise RuntimeError(f"Git command failed: {e.stderr.strip()}") from e
+
     # ------------------------------
     # OPERATIONS METHODS
     # ------------------------------
@@ -72,7 +205,8 @@ class SubmoduleOperations:
         repo_data: Dict[str, Any],
         path: str,
         git_clean: bool = False,
-        jobs: int = 1
+        jobs: int = 1,
+        dir_cache: Optional[set] = None
     ) -> Optional[str]:
         """
         Adds a new repository to the YAML file.
@@ -85,41 +219,74 @@ class SubmoduleOperations:
         depth = repo_data.get('depth')
 
         if not repo_url or not repo_path:
-            self.logger.error(f"Skipping '{repo_path}': 'url' or 'path' is missing.")
+            self.logger.error("Skipping '%s': 'url' or 'path' is missing.", repo_path)
             return None
 
         # Resolve relative path to absolute path
-        abs_repo_path = os.path.abspath(os.path.join(path, repo_path))
-        parent_dir = os.path.dirname(abs_repo_path)
+        abs_repo_path, parent_dir = self._resolve_paths(path, repo_path)
 
         # Recreate Git repository
         self._recreate_git(repo_url, branch, commit, abs_repo_path)
 
         # Ensure parent directory exists
-        if not os.path.exists(parent_dir):
-            os.makedirs(parent_dir)
+        os.makedirs(parent_dir, exist_ok=True)
 
         # Clone if repository does not exist
         try:
-            if not self._exist_repo(abs_repo_path):
-                self.logger.info(f"Cloning \033[1;33;1m{repo_path}\033[0m...")
+            if not self._exist_repo(abs_repo_path, dir_cache):
+                self.logger.info("Cloning \033[1;33;1m%s\033[0m...", repo_path)
                 self._clone(
                     repo_url, abs_repo_path, branch, depth, parent_dir, jobs
                 )
             else:
-                self.logger.info(f"Repository '{repo_path}' already exists at {repo_path}. Updating...")
-
-            if commit:
-                self._fetch_and_reset(commit, commit, abs_repo_path, jobs)
+                self.logger.info("Repository '%s' already exists. Updating...", repo_path)
+
+            # Only fetch the pinned commit when HEAD doesn't already point
+            # at it — a fresh clone of the right branch usually does, and
+            # the fetch is a full remote round-trip.
+            current = self._current_commit_hash(abs_repo_path)
+            if commit and current != commit:
+                current = self._fetch_reset_hash(
+                    commit, commit, abs_repo_path, jobs
+                )
+            elif commit:
+                # HEAD already at the pin: the fetch is skippable,
+                # discarding local modifications is not.
+                self._reset_clean(commit, abs_repo_path)
 
-            commit = self._current_commit_hash(abs_repo_path)
             if git_clean:
                 self._remove_git(abs_repo_path)
-            return commit
+            return current
         except Exception as e:
-            self.logger.error(f"Failed to update repository '{repo_path}': {e}")
+            self.logger.error("Failed to update repository '%s': %s", repo_path, e)
             return None
 
+    def confirm_local_changes(
+        self,
+        repo_data: Dict[str, Any],
+        path: str
+    ) -> bool:
+        """
+        Runs the lose-local-changes prompt for one repository and returns
+        True when the update may proceed (including when there is nothing
+        to lose). update() calls this itself on the serial path; batch
+        drivers must call it up front for every repo, on their own
+        thread, before dispatching to workers — prompts issued from a
+        thread pool interleave on stdin and a 'y' would attach to a
+        nondeterministic repository.
+        """
+        repo_path = repo_data.get('path')
+        abs_repo_path, _ = self._resolve_paths(path, repo_path)
+        if not self._has_git(abs_repo_path):
+            return True
+        confirmed = self._confirm(
+            f"\nDo you want to continue and lose local changes in"
+            f" \033[1;33;1m{repo_path}\033[0m? (y/N): "
+        )
+        if not confirmed:
+            self.logger.info('Update cancelled by user.')
+        return confirmed
+
     def update(
         self,
         repo_data: Dict[str, Any],
@@ -127,7 +294,8 @@ class SubmoduleOperations:
         remote: bool = False,
         git_clean: bool = False,
         ignore_local_changes: bool = False,
-        jobs: int = 1
+        jobs: int = 1,
+        dir_cache: Optional[set] = None
     ) -> Optional[str]:
         """
         Updates a repository to the specified commit hash.
@@ -137,37 +305,39 @@ class SubmoduleOperations:
         commit = repo_data.get('commit')
         branch = str(repo_data.get('branch'))
 
-        abs_repo_path = os.path.abspath(os.path.join(path, repo_path))
+        abs_repo_path, _ = self._resolve_paths(path, repo_path)
 
-        if self._has_git(abs_repo_path) and not ignore_local_changes:
-            response = input(
-                f"\nDo you want to continue and lose local changes in"
-                f" \033[1;33;1m{repo_path}\033[0m? (y/N): "
-            )
-            sys.stdout.write("\n")
-            if response.lower() not in ['y', 'yes']:
-                self.logger.info('Update cancelled by user.')
-                return None
+        if not ignore_local_changes and not self.confirm_local_changes(
+            repo_data, path
+        ):
+            return None
 
         # Recreate Git repository
         self._recreate_git(repo_url, branch, commit, abs_repo_path)
 
         # Clone if repository does not exist
-        if not self._exist_repo(abs_repo_path):
+        if not self._exist_repo(abs_repo_path, dir_cache):
             return self.clone(repo_data, path, git_clean, jobs)
 
         # Update repository
         try:
             if remote:
-                self._fetch_and_reset(
+                commit = self._fetch_reset_hash(
                     branch, f"origin/{branch}", abs_repo_path, jobs
                 )
             else:
-                self._fetch_and_reset(
-                    commit, commit, abs_repo_path, jobs
-                )
+                # Skip the remote round-trip when the working copy is
+                # already at the pinned commit — but still reset and
+                # clean, which is what the user just agreed to (or forced
+                # with --ignore-local-changes).
+                current = self._current_commit_hash(abs_repo_path)
+                if not commit or current != commit:
+                    commit = self._fetch_reset_hash(
+                        commit, commit, abs_repo_path, jobs
+                    )
+                else:
+                    self._reset_clean(commit, abs_repo_path)
 
-            commit = self._current_commit_hash(abs_repo_path)
             if git_clean:
                 self._remove_git(abs_repo_path)
 
@@ -177,9 +347,105 @@ class SubmoduleOperations:
             )
             return commit
         except Exception as e:
-            self.logger.error(f"Failed to update repository '{repo_path}': {e}")
+            self.logger.error("Failed to update repository '%s': %s", repo_path, e)
             return None
 
+    def clone_many(
+        self,
+        repos: List[Dict[str, Any]],
+        path: str,
+        git_clean: bool = False,
+        jobs: int = 1
+    ) -> List[Tuple[Dict[str, Any], Optional[str]]]:
+        """
+        Clones several repositories concurrently. Each clone spends almost
+        all of its wall-clock time blocked on network I/O in a git
+        subprocess, so independent repos parallelize near-linearly.
+        """
+        dir_cache = self._scan_parents(repos, path)
+        return self._run_many(
+            lambda repo_data: self.clone(
+                repo_data, path, git_clean, jobs, dir_cache
+            ),
+            repos,
+            jobs
+        )
+
+    def update_many(
+        self,
+        repos: List[Dict[str, Any]],
+        path: str,
+        remote: bool = False,
+        git_clean: bool = False,
+        ignore_local_changes: bool = False,
+        jobs: int = 1
+    ) -> List[Tuple[Dict[str, Any], Optional[str]]]:
+        """
+        Updates several repositories concurrently; see clone_many.
+        """
+        dir_cache = self._scan_parents(repos, path)
+        return self._run_many(
+            lambda repo_data: self.update(
+                repo_data, path, remote, git_clean, ignore_local_changes,
+                jobs, dir_cache
+            ),
+            repos,
+            jobs
+        )
+
+    def _scan_parents(self, repos: List[Dict[str, Any]], path: str) -> set:
+        """
+        Pre-stats sibling checkouts for a batch: one scandir per distinct
+        parent directory yields every existing child path, instead of one
+        exists() stat per repo later. Returned as a set of absolute paths
+        for the _exist_repo dir_cache parameter.
+        """
+        existing = set()
+        parents = set()
+        for repo_data in repos:
+            repo_path = repo_data.get('path')
+            if repo_path:
+                parents.add(self._resolve_paths(path, repo_path)[1])
+        for parent_dir in parents:
+            try:
+                with os.scandir(parent_dir) as entries:
+                    existing.update(entry.path for entry in entries)
+            except OSError:
+                pass
+        return existing
+
+    def _run_many(
+        self,
+        work: Callable[[Dict[str, Any]], Optional[str]],
+        repos: List[Dict[str, Any]],
+        jobs: int
+    ) -> List[Tuple[Dict[str, Any], Optional[str]]]:
+        """
+        Runs work(repo_data) across repos on a thread pool and returns
+        (repo_data, commit) pairs in completion order. Failures are logged
+        and yield a None commit, so one broken repo doesn't abort the
+        batch. Callers apply config mutations from the returned pairs in
+        their own thread; nothing shared is written from the workers.
+        """
+        results = []
+        workers = max(1, min(jobs, len(repos)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(work, repo_data): repo_data
+                for repo_data in repos
+            }
+            for future in as_completed(futures):
+                repo_data = futures[future]
+                try:
+                    results.append((repo_data, future.result()))
+                except Exception as e:
+                    self.logger.error(
+                        f"Failed to update repository "
+                        f"'{repo_data.get('path')}': {e}"
+                    )
+                    results.append((repo_data, None))
+        return results
+
     def rm(self, repo_data: Dict[str, Any], path: str) -> Optional[str]:
         """
         Removes a repository from the YAML file.
@@ -187,31 +453,66 @@ class SubmoduleOperations:
         repo_path = repo_data.get('path')
         if not os.path.exists(os.path.join(path, repo_path)):
             return
-        self.logger.info(f"Removing \033[1;33;1m{repo_path}\033[0m...")
+        self.logger.info("Removing \033[1;33;1m%s\033[0m...", repo_path)
         shutil.rmtree(os.path.join(path, repo_path))
         return
 
     def generate(self, gitmodules_file: str, output_file: str) -> Optional[str]:
         """
-        Generates a new YAML from .gitmodules file.
+        Generates a new YAML from .gitmodules file. The file is plain INI,
+        so it is parsed directly, and every gitlink commit is resolved by
+        a single 'git ls-tree HEAD' over all submodule paths — no
+        GitPython repo object and no per-submodule subprocess.
         """
-        repo_path = os.path.dirname(gitmodules_file)
-        repo = git.Repo(repo_path)
+        repo_path = os.path.dirname(gitmodules_file) or '.'
+
+        # interpolation=None: URLs may contain literal '%' (URL-encoded
+        # credentials), which BasicInterpolation would reject. strict=False
+        # lets duplicate sections degrade instead of raising.
+        parser = configparser.ConfigParser(interpolation=None, strict=False)
+        parser.read(gitmodules_file)
         repositories = []
-        for submodule in repo.submodules:
-            repositories.append(OrderedDict({
-                'path': submodule.path,
-                'url': submodule.url,
-                'branch': submodule.branch_name,
-                'commit': submodule.hexsha,
+        by_path = {}
+        for section in parser.sections():
+            if not section.startswith('submodule '):
+                continue
+            submodule = parser[section]
+            submodule_path = submodule.get('path')
+            if not submodule_path:
+                continue
+            # Plain dicts keep insertion order on Python 3.7+, so no
+            # OrderedDict (nor a custom representer for it) is needed.
+            repo = {
+                'path': submodule_path,
+                'url': submodule.get('url'),
+                'branch': submodule.get('branch'),
+                'commit': None,
                 'depth': 1
-            }))
+            }
+            repositories.append(repo)
+            by_path[submodule_path] = repo
+
+        if by_path:
+            # -z gives NUL-separated records with unquoted paths.
+            output = self._run_git_command(
+                ["ls-tree", "-z", "HEAD", "--", *by_path],
+                repo_path
+            )
+            for record in (output or '').split('\0'):
+                if not record:
+                    continue
+                meta, _, entry_path = record.partition('\t')
+                mode, object_type, sha = meta.split()
+                repo = by_path.get(entry_path)
+                if repo is not None and object_type == 'commit':
+                    repo['commit'] = sha
 
         with open(output_file, 'w') as f:
             yaml.dump(
                 {'repositories': repositories},
                 f,
-                Dumper=OrderedDictDumper
+                Dumper=_Dumper,
+                sort_keys=False
             )
         return repositories
 
@@ -220,23 +521,38 @@ class SubmoduleOperations:
     # ------------------------------
     def _remove_git(self, path: str) -> Optional[str]:
         """
-        Removes a Git repository.
+        Removes a Git repository. A '.git' can hold tens of thousands of
+        pack and ref files; one 'rm -rf' fork walks it in C instead of
+        shutil.rmtree's per-entry Python recursion. Windows keeps rmtree.
         """
-        shutil.rmtree(os.path.join(path, '.git'))
+        git_dir = os.path.join(path, '.git')
+        if os.name == 'posix':
+            subprocess.run(["rm", "-rf", git_dir], check=True)
+        else:
+            shutil.rmtree(git_dir)
         return None
 
     def _has_git(self, path: str) -> bool:
         """
-        Checks if a directory has a Git repository.
+        Checks if a directory has a Git repository. A single lstat on
+        'path/.git' covers both checks (the parent must exist for '.git'
+        to exist) and also matches worktrees/submodules where '.git' is a
+        file rather than a directory.
         """
-        return self._exist_repo(path) and os.path.exists(
-            os.path.join(path, '.git')
-        )
+        try:
+            os.lstat(os.path.join(path, '.git'))
+            return True
+        except OSError:
+            return False
 
-    def _exist_repo(self, path: str) -> bool:
+    def _exist_repo(self, path: str, dir_cache: Optional[set] = None) -> bool:
         """
-        Checks if a directory exists.
+        Checks if a directory exists. With a dir_cache (absolute child
+        paths pre-collected by _scan_parents) the answer is a set lookup
+        instead of a stat.
         """
+        if dir_cache is not None:
+            return path in dir_cache
         return os.path.exists(path)
 
     # ------------------------------
@@ -255,19 +571,28 @@ class SubmoduleOperations:
         """
         Clones a repository.
         """
-        clone_command = ["clone"]
-        if depth:
-            clone_command.extend(["--depth", str(depth)])
-        if branch:
-            clone_command.extend(["--branch", branch])
-        if jobs > 1:
-            clone_command.extend(["--jobs", str(jobs)])
-        clone_command.extend(["--filter=blob:none"])
-        clone_command.extend(["--single-branch"])
-        clone_command.extend([repo_url, repo_path])
-        self._run_git_command(clone_command, path)
+        # Wire protocol v2 multiplexes ref advertisement (a large saving on
+        # remotes with many refs); fetch.parallel lets the later promisor
+        # fetches of the blob-less clone run concurrently. The argv is
+        # assembled in a single allocation from conditional tuples.
+        parallel_args = (
+            ("-c", f"fetch.parallel={jobs}", ) if jobs > 1 else ()
+        )
+        depth_args = ("--depth", str(depth)) if depth else ()
+        # str(): unquoted numeric branches (e.g. 15.0) parse from YAML as
+        # floats, which subprocess argv rejects.
+        branch_args = ("--branch", str(branch)) if branch else ()
+        jobs_args = ("--jobs", str(jobs)) if jobs > 1 else ()
+        self._run_git_command(
+            [
+                "-c", "protocol.version=2", *parallel_args, "clone",
+                *depth_args, *branch_args, *jobs_args, *_CLONE_STATIC,
+                repo_url, repo_path,
+            ],
+            path
+        )
 
-    def _fetch_and_reset(
+    def _fetch_reset_hash(
         self,
         fetch_resource: str,
         reset_resource: str,
@@ -275,33 +600,92 @@ class SubmoduleOperations:
         jobs: int = 1
     ) -> Optional[str]:
         """
-        Fetches and resets a repository to the specified commit hash.
+        Fetches, resets and cleans a repository and returns the resulting
+        HEAD commit hash, all in a single subprocess invocation instead of
+        four separate git processes.
         """
-        fetch_command = ["fetch", "--depth", '1', 'origin', fetch_resource]
+        fetch_command = ["-c", "protocol.version=2"]
+        if jobs > 1:
+            fetch_command.extend(["-c", f"fetch.parallel={jobs}"])
+        fetch_command.extend(["fetch", "--depth", "1"])
         if jobs > 1:
             fetch_command.extend(["--jobs", str(jobs)])
-        self._run_git_command(fetch_command, path)
+        fetch_command.extend(["origin", str(fetch_resource)])
+        output = self._run_git_script(
+            [
+                fetch_command,
+                ["reset", "--quiet", "--hard", str(reset_resource)],
+                ["clean", "-ffd"],
+                ["rev-parse", "HEAD"],
+            ],
+            path
+        )
+        return output.splitlines()[-1].strip() if output else None
 
-        self._run_git_command([
-            "reset", "--quiet", "--hard", reset_resource],
+    def _reset_clean(self, reset_resource: str, path: str) -> None:
+        """
+        Local-only reset and clean for a repository whose pinned commit
+        is already checked out: no network traffic, but local changes and
+        untracked files are discarded exactly as the full fetch chain
+        would.
+        """
+        self._run_git_script(
+            [
+                ["reset", "--quiet", "--hard", str(reset_resource)],
+                ["clean", "-ffd"],
+            ],
             path
         )
-        self._run_git_command(["clean", "-ffd"], path)
+
+    def _read_head(self, repo_path: str) -> Optional[str]:
+        """
+        Resolves HEAD by reading the ref files directly — two sub-ms file
+        reads instead of a git fork+exec. Returns None for layouts this
+        doesn't understand (e.g. worktrees with a gitdir file) so the
+        caller can fall back to 'git rev-parse'.
+        """
+        git_dir = os.path.join(repo_path, '.git')
+        with open(os.path.join(git_dir, 'HEAD')) as f:
+            head = f.read().strip()
+        if not head.startswith('ref: '):
+            # Detached HEAD: the file holds the hash itself.
+            return head
+
+        ref = head[5:]
+        ref_path = os.path.join(git_dir, ref)
+        if os.path.exists(ref_path):
+            with open(ref_path) as f:
+                return f.read().strip()
+
+        # The ref may only exist in packed-refs.
+        with open(os.path.join(git_dir, 'packed-refs')) as f:
+            for line in f:
+                if line.rstrip('\n').endswith(' ' + ref):
+                    return line.split(' ', 1)[0]
+        return None
 
     def _current_commit_hash(self, repo_path: str) -> Optional[str]:
         """
-        Retrieves the current HEAD commit hash of a repository.
+        Retrieves the current HEAD commit hash of a repository. Callers
+        pass the already-resolved absolute path (see _resolve_paths), so
+        no re-normalization happens here.
         """
-        abs_repo_path = os.path.abspath(repo_path)
-        if not self._exist_repo(abs_repo_path) or not self._has_git(
-            abs_repo_path
-        ):
+        if not self._has_git(repo_path):
             return None
 
         try:
-            return self._run_git_command(["rev-parse", "HEAD"], abs_repo_path)
+            commit = self._read_head(repo_path)
+            if commit:
+                return commit
+        except OSError:
+            # '.git' is a file (worktree/submodule) or refs are missing;
+            # let git itself resolve it.
+            pass
+
+        try:
+            return self._run_git_command(["rev-parse", "HEAD"], repo_path)
         except Exception as e:
-            self.logger.error(f"Failed to get current commit hash for {repo_path}: {e}")
+            self.logger.error("Failed to get current commit hash for %s: %s", repo_path, e)
             return None
 
     def _recreate_git(
@@ -312,10 +696,26 @@ class SubmoduleOperations:
         path: str
     ) -> Optional[str]:
         """
-        Recreates a Git repository.
+        Recreates the '.git' of a working tree that lost it (git_clean),
+        re-pinning the recorded commit. The whole init/remote/checkout/
+        fetch/reset/clean chain runs as one shell invocation instead of
+        six git processes.
         """
-        if self._exist_repo(path) and not self._has_git(path):
-            self._run_git_command(["init"], path)
-            self._run_git_command(['remote', 'add', 'origin', url], path)
-            self._run_git_command(['checkout', '-b', branch], path)
-            self._fetch_and_reset(commit, commit, path)
+        # Check '.git' first: in the common healthy-repo case that single
+        # stat answers everything and the directory probe is skipped.
+        if not self._has_git(path) and self._exist_repo(path):
+            commit = str(commit)
+            self._run_git_script(
+                [
+                    ["init", "--quiet"],
+                    ["remote", "add", "origin", str(url)],
+                    ["checkout", "--quiet", "-b", str(branch)],
+                    [
+                        "-c", "protocol.version=2",
+                        "fetch", "--depth", "1", "origin", commit,
+                    ],
+                    ["reset", "--quiet", "--hard", commit],
+                    ["clean", "-ffd"],
+                ],
+                path
+            )